@@ -604,7 +604,7 @@ class ExcelCompiler:
         """
         if output_addrs is None:
             to_verify = list(self.formula_cells(sheet))
-            print(f'Found {len(to_verify)} formulas to evaluate')
+            self.log.info(f'Found {len(to_verify)} formulas to evaluate')
         elif list_like(output_addrs):
             to_verify = [AddressCell(addr) for addr in flatten(output_addrs)]
         else:
@@ -616,8 +616,8 @@ class ExcelCompiler:
             iterative_eval_tracker(**self.cycles)
         while to_verify:
             addr = to_verify.pop()
-            if len(to_verify) % 100 == 0:
-                print(f"{len(to_verify)} formulas left to process")
+            if len(to_verify) % 100 == 0 and self.log.isEnabledFor(logging.INFO):
+                self.log.info(f"{len(to_verify)} formulas left to process")
             try:
                 self._gen_graph(addr)
                 cell = self.cell_map[addr.address]
@@ -8,6 +8,7 @@
 #   https://www.gnu.org/licenses/gpl-3.0.en.html
 
 import ast
+import functools
 import importlib
 import logging
 import marshal
@@ -57,14 +58,54 @@ class Tokenizer(tokenizer.Tokenizer):
         super(Tokenizer, self).__init__(formula)
         self.items = self._items()
 
+    def _parse_brackets(self):
+        """Consume all the text between (possibly nested) square brackets
+
+        Jumps from bracket to bracket with str.find, instead of collecting
+        and sorting the position of every bracket in the rest of the formula.
+
+        Returns the number of characters matched. (Does not update
+        self.offset)
+        """
+        formula, start = self.formula, self.offset
+        assert formula[start] == '['
+        depth, idx = 0, start
+        while True:
+            right = formula.find(']', idx)
+            if right == -1:
+                raise tokenizer.TokenizerError(
+                    f"Encountered unmatched '[' in {formula}")
+            left = formula.find('[', idx, right)
+            if left == -1:
+                depth -= 1
+                idx = right + 1
+                if depth == 0:
+                    self.token.append(formula[start:idx])
+                    return idx - start
+            else:
+                depth += 1
+                idx = left + 1
+
     def _items(self):
-        """Convert to use our Token"""
-        t = [None] + [Token.from_token(t) for t in self.items] + [None]
+        """Convert to use our Token
+
+        Conversion, whitespace removal and the address fixups below are
+        done in a single walk over the openpyxl tokens, and only the
+        tokens which are kept get converted.
+        """
+        items = self.items
+        last = len(items) - 1
 
         # convert or remove unneeded whitespace
         tokens = []
-        for prev_token, token, next_token in zip(t, t[1:], t[2:]):
-            if token.type != Token.WSPACE or not prev_token or not next_token:
+        for i, item in enumerate(items):
+            if item.type != Token.WSPACE or i == 0 or i == last:
+                # drop unary +
+                if item.type == Token.OP_PRE and item.value == '+':
+                    continue
+
+                token = Token.from_token(item)
+
                 # ::HACK:: this is code to make the tokenizer behave like
                 # this change to the openpyxl tokenizer.
                 # https://bitbucket.org/openpyxl/openpyxl/pull-requests/345
@@ -78,7 +119,6 @@ class Tokenizer(tokenizer.Tokenizer):
                     tokens.append(Token(addr, Token.OPERAND, Token.RANGE))
                     tokens.append(Token(':', Token.OP_IN, ''))
                     token.value = func
-                    tokens.append(token)
 
                 elif (token.matches(type_=Token.OPERAND,
                                     subtype=Token.RANGE) and
@@ -86,23 +126,24 @@ class Tokenizer(tokenizer.Tokenizer):
                     # split the address on the ':'
                     tokens.append(Token(':', Token.OP_IN, ''))
                     token.value = token.value[1:]
-                    tokens.append(token)
 
-                # drop unary +
-                elif not token.matches(type_=Token.OP_PRE, value='+'):
-                    tokens.append(token)
-
-            elif (
-                prev_token.matches(type_=Token.FUNC, subtype=Token.CLOSE) or
-                prev_token.matches(type_=Token.PAREN, subtype=Token.CLOSE) or
-                prev_token.type == Token.OPERAND
+                tokens.append(token)
+                continue
+
+            # operands are the common neighbors, so test for them first
+            prev_type = items[i - 1].type
+            next_type = items[i + 1].type
+            if (
+                prev_type == Token.OPERAND or
+                items[i - 1].subtype == Token.CLOSE and
+                prev_type in (Token.FUNC, Token.PAREN)
             ) and (
-                next_token.matches(type_=Token.FUNC, subtype=Token.OPEN) or
-                next_token.matches(type_=Token.PAREN, subtype=Token.OPEN) or
-                next_token.type == Token.OPERAND
+                next_type == Token.OPERAND or
+                items[i + 1].subtype == Token.OPEN and
+                next_type in (Token.FUNC, Token.PAREN)
             ):
                 # this whitespace is an intersect operator
-                tokens.append(Token(token.value, Token.OP_IN, Token.INTERSECT))
+                tokens.append(Token(item.value, Token.OP_IN, Token.INTERSECT))
 
         return tokens
 
@@ -117,6 +158,8 @@ class Token(tokenizer.Token):
     class Precedence:
         """Small wrapper class to manage operator precedence during parsing"""
 
+        __slots__ = ('precedence', 'associativity')
+
         def __init__(self, precedence, associativity):
             self.precedence = precedence
             self.associativity = associativity
@@ -519,6 +562,89 @@ class FunctionNode(ASTNode):
         return f'{func}({to_emit})'
 
 
+def _amend_func_open(token, next_token):
+    if next_token.matches(Token.SEP, Token.ARG):
+        return (token, Token('(', Token.PAREN, Token.OPEN),
+                Token('', Token.OPERAND, Token.EMPTY))
+    return token, Token('(', Token.PAREN, Token.OPEN)
+
+
+def _amend_func_close(token, next_token):
+    return Token(')', Token.PAREN, Token.CLOSE),
+
+
+def _amend_array_open(token, next_token):
+    return (token,
+            Token('(', Token.PAREN, Token.OPEN),
+            Token('', Token.ARRAYROW, Token.OPEN),
+            Token('(', Token.PAREN, Token.OPEN))
+
+
+def _amend_array_close(token, next_token):
+    return token, Token(')', Token.PAREN, Token.CLOSE)
+
+
+def _amend_sep_row(token, next_token):
+    return (Token(')', Token.PAREN, Token.CLOSE),
+            Token(',', Token.SEP, Token.ARG),
+            Token('', Token.ARRAYROW, Token.OPEN),
+            Token('(', Token.PAREN, Token.OPEN))
+
+
+def _amend_sep_arg(token, next_token):
+    if next_token.matches(Token.SEP, Token.ARG) or \
+            next_token.matches(Token.FUNC, Token.CLOSE):
+        return token, Token('', Token.OPERAND, Token.EMPTY)
+    return token,
+
+
+def _amend_paren_open(token, next_token):
+    token.value = '('
+    return token,
+
+
+def _amend_paren_close(token, next_token):
+    token.value = ')'
+    return token,
+
+
+# Dispatch table for amending the token stream, keyed on (type, subtype).
+# Tokens not in the table (operands, operators, ...) are passed through as is.
+_TOKEN_AMENDERS = {
+    (Token.FUNC, Token.OPEN): _amend_func_open,
+    (Token.FUNC, Token.CLOSE): _amend_func_close,
+    (Token.ARRAY, Token.OPEN): _amend_array_open,
+    (Token.ARRAY, Token.CLOSE): _amend_array_close,
+    (Token.SEP, Token.ROW): _amend_sep_row,
+    (Token.SEP, Token.ARG): _amend_sep_arg,
+    (Token.PAREN, Token.OPEN): _amend_paren_open,
+    (Token.PAREN, Token.CLOSE): _amend_paren_close,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _amended_tokens(expression):
+    """Tokenize a formula and amend the token stream to ease code production
+
+    Workbooks often contain many copies of the same formula, so this is
+    cached by the formula text.
+
+    :param expression: an excel formula string
+    :return: tuple of (value, type, subtype) tuples
+    """
+    items = Tokenizer(expression).items
+    last = len(items) - 1
+    tokens = []
+    for i, token in enumerate(items):
+        amend = _TOKEN_AMENDERS.get((token.type, token.subtype))
+        if amend is None:
+            tokens.append(token)
+        else:
+            tokens.extend(amend(token, items[i + 1] if i < last else None))
+
+    return tuple((t.value, t.type, t.subtype) for t in tokens)
+
+
 class ExcelFormula:
     """Take an Excel formula and compile it to Python code."""
 
@@ -647,68 +773,31 @@ class ExcelFormula:
             algorithm-to-allow-variable-numbers-of-arguments-to-functions/
         """
 
-        lexer = Tokenizer(expression)
-
-        # amend token stream to ease code production
-        tokens = []
-        for token, next_token in zip(lexer.items, lexer.items[1:] + [None]):
-
-            if token.matches(Token.FUNC, Token.OPEN):
-                tokens.append(token)
-                token = Token('(', Token.PAREN, Token.OPEN)
-                if next_token.matches(Token.SEP, Token.ARG):
-                    tokens.append(token)
-                    token = Token('', Token.OPERAND, Token.EMPTY)
-
-            elif token.matches(Token.FUNC, Token.CLOSE):
-                token = Token(')', Token.PAREN, Token.CLOSE)
-
-            elif token.matches(Token.ARRAY, Token.OPEN):
-                tokens.append(token)
-                tokens.append(Token('(', Token.PAREN, Token.OPEN))
-                tokens.append(Token('', Token.ARRAYROW, Token.OPEN))
-                token = Token('(', Token.PAREN, Token.OPEN)
-
-            elif token.matches(Token.ARRAY, Token.CLOSE):
-                tokens.append(token)
-                token = Token(')', Token.PAREN, Token.CLOSE)
-
-            elif token.matches(Token.SEP, Token.ROW):
-                tokens.append(Token(')', Token.PAREN, Token.CLOSE))
-                tokens.append(Token(',', Token.SEP, Token.ARG))
-                tokens.append(Token('', Token.ARRAYROW, Token.OPEN))
-                token = Token('(', Token.PAREN, Token.OPEN)
-
-            elif token.matches(Token.SEP, Token.ARG):
-                if next_token.matches(Token.SEP, Token.ARG) or \
-                        next_token.matches(Token.FUNC, Token.CLOSE):
-                    tokens.append(token)
-                    token = Token('', Token.OPERAND, Token.EMPTY)
-
-            elif token.matches(Token.PAREN, Token.OPEN):
-                token.value = '('
-
-            elif token.matches(Token.PAREN, Token.CLOSE):
-                token.value = ')'
-
-            tokens.append(token)
+        # tokens are mutable, so build fresh ones from the cached stream
+        tokens = [Token(*token) for token in _amended_tokens(expression)]
 
         output = []
         stack = []
         were_values = []
         arg_count = []
 
+        # bind the constants and methods used per token as locals
+        OPERAND, PAREN, SEP = Token.OPERAND, Token.PAREN, Token.SEP
+        OPEN, CLOSE = Token.OPEN, Token.CLOSE
+        ast_node = self._ast_node
+
         for token in tokens:
-            if token.type == token.OPERAND:
+            token_type, token_subtype = token.type, token.subtype
+            if token_type == OPERAND:
 
-                output.append(self._ast_node(token))
+                output.append(ast_node(token))
                 if were_values:
                     were_values[-1] = True
 
-            elif token.type != token.PAREN and token.subtype == token.OPEN:
+            elif token_type != PAREN and token_subtype == OPEN:
 
-                if token.type in (token.ARRAY, Token.ARRAYROW):
-                    token = Token(token.type, token.type, token.subtype)
+                if token_type in (Token.ARRAY, Token.ARRAYROW):
+                    token = Token(token_type, token_type, token_subtype)
 
                 stack.append(token)
                 arg_count.append(0)
@@ -716,10 +805,10 @@ class ExcelFormula:
                     were_values[-1] = True
                 were_values.append(False)
 
-            elif token.type == token.SEP:
+            elif token_type == SEP:
 
-                while stack and (stack[-1].subtype != token.OPEN):
-                    output.append(self._ast_node(stack.pop()))
+                while stack and (stack[-1].subtype != OPEN):
+                    output.append(ast_node(stack.pop()))
 
                 if not len(were_values):
                     raise FormulaParserError("Mismatched or misplaced parentheses")
@@ -732,18 +821,18 @@ class ExcelFormula:
 
                 while stack and stack[-1].is_operator and (
                         token.precedence < stack[-1].precedence):
-                    output.append(self._ast_node(stack.pop()))
+                    output.append(ast_node(stack.pop()))
 
                 stack.append(token)
 
-            elif token.subtype == token.OPEN:
-                assert token.type in (token.FUNC, token.PAREN, token.ARRAY)
+            elif token_subtype == OPEN:
+                assert token_type in (Token.FUNC, PAREN, Token.ARRAY)
                 stack.append(token)
 
-            elif token.subtype == token.CLOSE:
+            elif token_subtype == CLOSE:
 
-                while stack and stack[-1].subtype != Token.OPEN:
-                    output.append(self._ast_node(stack.pop()))
+                while stack and stack[-1].subtype != OPEN:
+                    output.append(ast_node(stack.pop()))
 
                 if not stack:
                     raise FormulaParserError("Mismatched or misplaced parentheses")
@@ -751,12 +840,12 @@ class ExcelFormula:
                 stack.pop()
 
                 if stack and stack[-1].is_funcopen:
-                    f = self._ast_node(stack.pop())
+                    f = ast_node(stack.pop())
                     f.num_args = arg_count.pop() + int(were_values.pop())
                     output.append(f)
 
             else:
-                assert token.type == token.WSPACE, f'Unexpected token: {token}'
+                assert token_type == Token.WSPACE, f'Unexpected token: {token}'
 
         while stack:
             if stack[-1].subtype in (Token.OPEN, Token.CLOSE):
@@ -10,6 +10,7 @@
 """
 Python equivalents of various excel functions
 """
+import functools
 import math
 import sys
 from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP, ROUND_UP
@@ -235,7 +236,12 @@ def npv(rate, *args):
     rate += 1
     cashflow = [x for x in flatten(args, coerce=coerce_to_number)
                 if is_number(x) and not isinstance(x, bool)]
-    return sum(x * rate ** -i for i, x in enumerate(cashflow, start=1))
+
+    # Horner's scheme: one divide per cashflow instead of one pow
+    result = 0
+    for x in reversed(cashflow):
+        result = (result + x) / rate
+    return result
 
 
 @excel_math_func
@@ -279,7 +285,7 @@ def round_(number, num_digits=0):
     num_digits = int(num_digits)
     if num_digits >= 0:  # round to the right side of the point
         return float(Decimal(repr(number)).quantize(
-            Decimal(repr(pow(10, -num_digits))),
+            _decimal_quantum(num_digits),
             rounding=ROUND_HALF_UP
         ))
         # see https://docs.python.org/2/library/functions.html#round
@@ -289,9 +295,14 @@ def round_(number, num_digits=0):
         return round(number, num_digits)
 
 
+@functools.lru_cache()
+def _decimal_quantum(num_digits):
+    """The Decimal to quantize to for rounding to `num_digits` digits"""
+    return Decimal(f'1E{"+-"[num_digits >= 0]}{abs(num_digits)}')
+
+
 def _round(number, num_digits, rounding):
-    num_digits = int(num_digits)
-    quant = Decimal(f'1E{"+-"[num_digits >= 0]}{abs(num_digits)}')
+    quant = _decimal_quantum(int(num_digits))
     return float(Decimal(repr(number)).quantize(quant, rounding=rounding))
 
 
@@ -8,6 +8,7 @@
 #   https://www.gnu.org/licenses/gpl-3.0.en.html
 
 import collections
+import functools
 import itertools as it
 import operator
 import re
@@ -292,21 +293,32 @@ class AddressRange(collections.namedtuple(
             self._size = AddressSize(height, width)
         return self._size
 
+    @property
+    def _columns(self):
+        """(col_idx, column letters) for each column in the range"""
+        return tuple((col, (col or '') and get_column_letter(col))
+                     for col in range(self.start.col_idx, self.end.col_idx + 1))
+
+    def _address_cell(self, col_idx, column, row):
+        """AddressCell built directly, without re-parsing or re-validating"""
+        coordinate = f'{column}{row or ""}'
+        address = f'{self.sheet}!{coordinate}' if self.sheet else coordinate
+        return AddressCell(address, self.sheet, col_idx, row, coordinate)
+
     @property
     def rows(self):
         """Get each address for every cell, yields one row at a time."""
-        col_range = self.start.col_idx, self.end.col_idx + 1
+        columns = self._columns
         for row in range(self.start.row, self.end.row + 1):
-            yield (AddressCell((col, row, col, row), sheet=self.sheet)
-                   for col in range(*col_range))
+            yield (self._address_cell(col_idx, column, row)
+                   for col_idx, column in columns)
 
     @property
     def cols(self):
         """Get each address for every cell, yields one column at a time."""
-        col_range = self.start.col_idx, self.end.col_idx + 1
-        for col in range(*col_range):
-            yield (AddressCell((col, row, col, row), sheet=self.sheet)
-                   for row in range(self.start.row, self.end.row + 1))
+        rows = range(self.start.row, self.end.row + 1)
+        for col_idx, column in self._columns:
+            yield (self._address_cell(col_idx, column, row) for row in rows)
 
     def address_at_offset(self, row_inc=0, col_inc=0):
         return self.start.address_at_offset(row_inc=row_inc, col_inc=col_inc)
@@ -339,16 +351,27 @@ class AddressRange(collections.namedtuple(
         elif address in ERROR_CODES:
             return address
 
-        sheetname, addr = split_sheetname(address, sheet=sheet)
-        addr_tuple, sheetname = range_boundaries(
-            addr, sheet=sheetname, cell=cell)
+        elif cell is None:
+            # without a cell, the address only depends on the two strings
+            return _create_address_cached(address, sheet)
 
-        if isinstance(addr_tuple, AddressMultiAreaRange):
-            return addr_tuple
-        elif None in addr_tuple or addr_tuple[0:2] != addr_tuple[2:]:
-            return AddressRange(addr_tuple, sheet=sheetname)
-        else:
-            return AddressCell(addr_tuple, sheet=sheetname)
+        return _create_address(address, sheet, cell)
+
+
+def _create_address(address, sheet='', cell=None):
+    sheetname, addr = split_sheetname(address, sheet=sheet)
+    addr_tuple, sheetname = range_boundaries(
+        addr, sheet=sheetname, cell=cell)
+
+    if isinstance(addr_tuple, AddressMultiAreaRange):
+        return addr_tuple
+    elif None in addr_tuple or addr_tuple[0:2] != addr_tuple[2:]:
+        return AddressRange(addr_tuple, sheet=sheetname)
+    else:
+        return AddressCell(addr_tuple, sheet=sheetname)
+
+
+_create_address_cached = functools.lru_cache(maxsize=4096)(_create_address)
 
 
 class AddressCell(collections.namedtuple(
@@ -939,7 +962,19 @@ def uniqueify(seq):
     return tuple(x for x in seq if x not in seen and not seen.add(x))
 
 
+def _is_non_numeric_str(value):
+    """Cheap check for strings which int() and float() can never convert
+
+    Addresses, text and error strings fail on the first non-blank char,
+    which avoids raising and catching a ValueError for each of them.
+    """
+    lead = value.lstrip()[:1]
+    return lead in ('#', '"') or lead.isalpha() and lead not in 'iInN'
+
+
 def is_number(value):
+    if isinstance(value, str) and _is_non_numeric_str(value):
+        return False
     try:
         float(value)
         return True
@@ -964,6 +999,9 @@ def coerce_to_number(value, convert_all=False):
     if convert_all and value.upper() in ('TRUE', 'FALSE', EMPTY):
         return int(len(value) == 4)
 
+    if _is_non_numeric_str(value):
+        return value
+
     try:
         if '.' not in value:
             return int(value)
@@ -1012,6 +1050,10 @@ def handle_ifs(args, op_range=None):
             if size != (len(rng), len(rng[0])):
                 return VALUE_ERROR
 
+    if len(ranges) == 1:
+        # a single criteria, so there is nothing to cross check
+        return find_corresponding_index(ranges[0], args[1])
+
     # count the number of times a particular cell matches the criteria
     index_counts = collections.Counter(it.chain.from_iterable(
         find_corresponding_index(rng, criteria)
@@ -1033,6 +1075,7 @@ def build_wildcard_re(lookup_value):
         return None
 
 
+@functools.lru_cache(maxsize=1024, typed=True)
 def criteria_parser(criteria):
     """
     General rules:
@@ -1047,6 +1090,9 @@ def criteria_parser(criteria):
        any single character; an asterisk matches any sequence of
        characters. If you want to find an actual question mark or
        asterisk, type a tilde (~) preceding the character.
+
+    The checks hold no state, so they are cached and shared between calls
+    with the same criteria.
     """
 
     if is_number(criteria):
@@ -51,6 +51,12 @@ class ExcelWrapper:
         result = self.get_range(address)
         if isinstance(address, AddressCell):
             return result.formula if result.formula.startswith("=") else None
+        elif isinstance(result.formula, tuple):
+            # use the formulas already read for the range, cell by cell
+            return tuple(tuple(
+                formula if formula.startswith("=") else None
+                for formula in row
+            ) for row in result.formula)
         else:
             return tuple(tuple(
                 self.get_formula_from_range(a) for a in row
@@ -62,6 +68,11 @@ class ExcelWrapper:
         result = self.get_range(address)
         if isinstance(address, AddressCell):
             return result.formula or result.values
+        elif isinstance(result.formula, tuple):
+            # use the formulas and values already read for the range
+            return tuple(tuple(
+                formula or value for formula, value in zip(*rows)
+            ) for rows in zip(result.formula, result.values))
         else:
             return tuple(tuple(
                 self.get_formula_or_value(a) for a in row
@@ -321,22 +332,18 @@ class ExcelOpxWrapper(ExcelWrapper):
             sheet = self.workbook.active
             sheet_dataonly = self.workbook_dataonly.active
 
-        with mock.patch('openpyxl.worksheet._reader.from_excel',
-                        self.from_excel):
-            # work around type coercion to datetime that causes some issues
-
-            if address.is_unbounded_range:
-                # bound the address range to the data in the spreadsheet
-                address = address & AddressRange(
-                    (1, 1, *self.max_col_row(sheet.title)),
-                    sheet=sheet.title)
-
-            cells = sheet[address.coordinate]
-            cells_dataonly = sheet_dataonly[address.coordinate]
-            if isinstance(cells, (Cell, MergedCell)):
-                return _OpxCell(cells, cells_dataonly, address)
-            else:
-                return _OpxRange(cells, cells_dataonly, address)
+        if address.is_unbounded_range:
+            # bound the address range to the data in the spreadsheet
+            address = address & AddressRange(
+                (1, 1, *self.max_col_row(sheet.title)),
+                sheet=sheet.title)
+
+        cells = sheet[address.coordinate]
+        cells_dataonly = sheet_dataonly[address.coordinate]
+        if isinstance(cells, (Cell, MergedCell)):
+            return _OpxCell(cells, cells_dataonly, address)
+        else:
+            return _OpxRange(cells, cells_dataonly, address)
 
     def get_used_range(self):
         return self.workbook.active.iter_rows()
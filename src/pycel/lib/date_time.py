@@ -31,12 +31,14 @@ from pycel.lib.function_helpers import (
 
 
 DATE_ZERO = dt.datetime(1899, 12, 30)
+DATE_ZERO_ORDINAL = DATE_ZERO.toordinal()
 DATE_MAX = dt.datetime(9999, 12, 31)  # last legal value
 DATE_MAX_INT = (DATE_MAX - DATE_ZERO).days + 1  # first illegal value
 SECOND = 1 / 24 / 60 / 60
 MICROSECOND = SECOND / 1E6
 LEAP_1900_SERIAL_NUMBER = 60  # magic number for non-existent 1900/02/29
 LEAP_1900_TUPLE = 1900, 2, 29
+DAYS_IN_MONTH = (None, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
 TIME_CHARS = set('0123456789')
 SECS_CHARS = TIME_CHARS | {'.'}
@@ -72,6 +74,7 @@ def time_value_wrapper(f):
     return wrapped
 
 
+@functools.lru_cache(maxsize=4096)
 def date_from_int(datestamp):
 
     if datestamp == LEAP_1900_SERIAL_NUMBER:
@@ -101,16 +104,15 @@ def time_from_serialnumber_with_microseconds(serialnumber):
 
 
 def time_from_serialnumber(serialnumber):
-    at_hours = (serialnumber + MICROSECOND) * 24
-    hours = math.floor(at_hours)
-    at_mins = (at_hours - hours) * 60
-    mins = math.floor(at_mins)
-    secs = (at_mins - mins) * 60
-    return hours % 24, mins, int(round(secs - 1.1E-6, 0))
+    # round once to whole seconds, so 59.6 secs carries into the minute
+    seconds = round((serialnumber % 1 + MICROSECOND) * 86400 - 1.1E-6)
+    mins, secs = divmod(seconds, 60)
+    hours, mins = divmod(mins, 60)
+    return hours % 24, mins, secs
 
 
 def is_leap_year(year):
-    if not is_number(year):
+    if not isinstance(year, int) and not is_number(year):
         raise TypeError(f"{year} must be a number")
     if year <= 0:
         raise TypeError(f"{year} must be strictly positive")
@@ -120,11 +122,16 @@ def is_leap_year(year):
     return year % 4 == 0 and year % 100 != 0 or year % 400 == 0 or year == 1900
 
 
+def leap_years_through(year):
+    """number of leap years from year 1 through year, including excel's 1900"""
+    return year // 4 - year // 100 + year // 400 + (year >= 1900)
+
+
 def max_days_in_month(month, year):
     if month == 2 and is_leap_year(year):
         return 29
 
-    return calendar.monthrange(year, month)[1]
+    return DAYS_IN_MONTH[month]
 
 
 def normalize_year(y, m, d):
@@ -134,17 +141,29 @@ def normalize_year(y, m, d):
         y += y_plus
         m -= y_plus * 12
 
-    if d <= 0:
-        d += max_days_in_month(m, y)
+    # step whole years first so large day offsets stay cheap.  The year
+    # from (y, m, 1) to (y + 1, m, 1) holds the February of y + 1 if m > 2
+    while d > 366:
+        d -= 366 if is_leap_year(y + (m > 2)) else 365
+        y += 1
+    while d < -365:
+        y -= 1
+        d += 366 if is_leap_year(y + (m > 2)) else 365
+
+    # non-positive days borrow from the preceding months
+    while d <= 0:
         m -= 1
-        y, m, d = normalize_year(y, m, d)
+        if m == 0:
+            y, m = y - 1, 12
+        d += max_days_in_month(m, y)
 
-    else:
+    days_in_month = max_days_in_month(m, y)
+    while d > days_in_month:
+        d -= days_in_month
+        m += 1
+        if m == 13:
+            y, m = y + 1, 1
         days_in_month = max_days_in_month(m, y)
-        if d > days_in_month:
-            m += 1
-            d -= days_in_month
-            y, m, d = normalize_year(y, m, d)
 
     return y, m, d
 
@@ -176,23 +195,21 @@ def yearfrac_basis_0(beg, end):
 def yearfrac_basis_1(beg, end):
     # http://svn.finmath.net/finmath%20lib/trunk/src/main/java/net/
     #   finmath/time/daycount/DayCountConvention_ACT_ACT_YEARFRAC.java
-    delta = date(*end) - date(*beg)
+    beg_serial = date(*beg)
+    end_serial = date(*end)
+    delta = end_serial - beg_serial
 
     if delta <= 365:
-        if (is_leap_year(beg[0]) and date(*beg) <= date(beg[0], 2, 29) or
-            is_leap_year(end[0]) and date(*end) >= date(end[0], 2, 29) or
+        if (is_leap_year(beg[0]) and beg_serial <= date(beg[0], 2, 29) or
+            is_leap_year(end[0]) and end_serial >= date(end[0], 2, 29) or
                 is_leap_year(beg[0]) and is_leap_year(end[0])):
             denom = 366
         else:
             denom = 365
     else:
-        year_range = range(beg[0], end[0] + 1)
-        nb = 0
-
-        for y in year_range:
-            nb += 366 if is_leap_year(y) else 365
-
-        denom = nb / len(year_range)
+        num_years = end[0] - beg[0] + 1
+        num_leap_years = leap_years_through(end[0]) - leap_years_through(beg[0] - 1)
+        denom = (365 * num_years + num_leap_years) / num_years
 
     return delta / denom
 
@@ -279,10 +296,16 @@ class DateTimeFormatter:
     FORMAT_DATETIME_CONVERSION_LOOKUP = FORMAT_DATETIME_CONVERSION_LOOKUP(
         FORMAT_DATETIME_CONVERSIONS)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _conversion(format_str):
+        """Find the conversion for a format token, once per token"""
+        return DateTimeFormatter.FORMAT_DATETIME_CONVERSION_LOOKUP[format_str[0]](format_str)
+
     def format(self, format_str):
         """Format datetime using a single token from a custom format"""
         try:
-            return self.FORMAT_DATETIME_CONVERSION_LOOKUP[format_str[0]](format_str)(self)
+            return self._conversion(format_str)(self)
         except (KeyError, ValueError, AttributeError):
             return VALUE_ERROR
 
@@ -407,7 +430,7 @@ def date(year, month_, day):
     year, month_, day = normalize_year(year, month_, day)
 
     try:
-        result = (dt.datetime(year, month_, day) - DATE_ZERO).days
+        result = dt.date(year, month_, day).toordinal() - DATE_ZERO_ORDINAL
         if result <= 60:
             result -= 1
     except ValueError:
@@ -442,6 +465,14 @@ class DateutilParserInfo(dateutil.parser.parserinfo):
 def datevalue(value):
     # Excel reference: https://support.microsoft.com/en-us/office/
     #   datevalue-function-df8b07d4-7761-4a93-bc33-b7471bbff252
+    if not isinstance(value, str):
+        return _datevalue(value, None)
+
+    # dates without a year are in the current year, so key on today too
+    return _datevalue_cached(value, dt.date.today())
+
+
+def _datevalue(value, today):
     parserinfo = DateutilParserInfo()
     try:
         a_date = dateutil.parser.parse(value, parserinfo=parserinfo).date()
@@ -453,7 +484,7 @@ def datevalue(value):
         else:
             return VALUE_ERROR
 
-    serial_number = (a_date - DATE_ZERO.date()).days
+    serial_number = a_date.toordinal() - DATE_ZERO_ORDINAL
     if serial_number <= LEAP_1900_SERIAL_NUMBER:
         serial_number -= 1
         if serial_number < 1:
@@ -461,6 +492,9 @@ def datevalue(value):
     return serial_number
 
 
+_datevalue_cached = functools.lru_cache(maxsize=1024)(_datevalue)
+
+
 @serial_number_wrapper
 def day(serial_number):
     # Excel reference: https://support.microsoft.com/en-us/office/
@@ -568,12 +602,19 @@ def timevalue(value):
     #   timevalue-function-0b615c12-33d8-4431-bf3d-f3eb6d186645
     if not isinstance(value, str):
         return VALUE_ERROR
+    return _timevalue(value)
+
 
+@functools.lru_cache(maxsize=1024)
+def _timevalue(value):
     if value in ERROR_CODES:
         return value
 
-    fields = value.lower().replace(':', ' ').split()
     colons = value.count(':')
+    if colons not in (1, 2):
+        return VALUE_ERROR
+
+    fields = value.lower().replace(':', ' ').split()
     have_secs = True
     if colons == 1:
         if '.' in fields[1][:-1]:
@@ -584,8 +625,6 @@ def timevalue(value):
                 fields[1] = fields[1][:-1]
             fields.insert(2, '0')
             have_secs = False
-    elif colons != 2:
-        return VALUE_ERROR
 
     # validate characters present
     if set(fields[0]) - TIME_CHARS or set(fields[1]) - TIME_CHARS or set(fields[2]) - SECS_CHARS:
@@ -616,7 +655,7 @@ def timevalue(value):
 def today():
     # Excel reference: https://support.microsoft.com/en-us/office/
     #   today-function-5eb3078d-a82c-4736-8930-2f51a028fdd9
-    return (dt.date.today() - DATE_ZERO.date()).days
+    return dt.date.today().toordinal() - DATE_ZERO_ORDINAL
 
 
 @serial_number_wrapper
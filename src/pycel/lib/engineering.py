@@ -19,11 +19,18 @@ from pycel.lib.function_helpers import (
 
 
 _SIZE_MASK = {2: 512, 8: 0x20000000, 16: 0x8000000000}
-_BASE_TO_FUNC = {2: bin, 8: oct, 16: hex}
+_BASE_FORMAT = {2: 'b', 8: 'o', 16: 'X'}
+
+
+def _flat_values(value):
+    # most calls pass a single scalar, which does not need flattening
+    if value is None or isinstance(value, (str, int, float)):
+        return value,
+    return tuple(flatten(value))
 
 
 def _base2dec(value, base):
-    value = list(flatten(value))
+    value = _flat_values(value)
     if len(value) != 1 or isinstance(value[0], bool):
         return VALUE_ERROR
 
@@ -48,7 +55,7 @@ def _base2dec(value, base):
 
 
 def _dec2base(value, places=None, base=16):
-    value = list(flatten(value))
+    value = _flat_values(value)
     if len(value) != 1 or isinstance(value[0], bool):
         return VALUE_ERROR
 
@@ -73,7 +80,7 @@ def _dec2base(value, places=None, base=16):
     if value < 0:
         value += mask << 1
 
-    value = _BASE_TO_FUNC[base](value)[2:].upper()
+    value = format(value, _BASE_FORMAT[base])
     if places is None:
         places = 0
     else:
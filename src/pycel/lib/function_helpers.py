@@ -12,6 +12,8 @@ import functools
 import inspect
 import sys
 
+import numpy as np
+
 from pycel.excelutil import (
     AddressCell,
     AddressRange,
@@ -32,6 +34,10 @@ ALL_ARG_INDICES = frozenset(range(512))
 
 star_args = set()
 
+# CSE arrays with more cells than this are mapped with numpy.frompyfunc
+CSE_NUMPY_MIN_CELLS = 32
+CSE_NUMPY_MAX_ARGS = 32
+
 
 def excel_helper(cse_params=None,
                  bool_params=None,
@@ -89,45 +95,9 @@ def apply_meta(f, meta=None, name_space=None):
     if meta:
         meta['name_space'] = name_space
 
-        # find what all_params for this function should look like
-        try:
-            sig = inspect.signature(f)
-            if any(param.kind == inspect.Parameter.VAR_KEYWORD
-                   for param in sig.parameters.values()):
-                raise RuntimeError(
-                    f'Function {f.__name__}: **kwargs not allowed in signature.')
-        except ValueError:
-            # some built-ins do not have signature information
-            sig = None  # pragma: no cover
-        if sig and any(param.kind == inspect.Parameter.VAR_POSITIONAL
-                       for param in sig.parameters.values()):
-            all_params = ALL_ARG_INDICES
-        else:
-            all_params = set(range(getattr(getattr(f, '__code__', None), 'co_argcount', 0))
-                             ) or ALL_ARG_INDICES
-
-        # process error strings
-        err_str_params = meta['err_str_params']
-        if err_str_params is not None:
-            f = error_string_wrapper(
-                f, all_params if err_str_params == -1 else err_str_params)
-
-        # process number parameters
-        number_params = meta['number_params']
-        if number_params is not None:
-            f = nums_wrapper(
-                f, all_params if number_params == -1 else number_params)
-
-        # process str parameters
-        str_params = meta['str_params']
-        if str_params is not None:
-            f = strs_wrapper(f, all_params if str_params == -1 else str_params)
-
-        # process CSE parameters
-        cse_params = meta['cse_params']
-        if cse_params is not None:
-            f = cse_array_wrapper(
-                f, all_params if cse_params == -1 else cse_params)
+        f = _value_params_wrapper(
+            f, meta['err_str_params'], meta['number_params'],
+            meta['str_params'], meta['cse_params'])
 
         # process reference parameters
         ref_params = meta['ref_params']
@@ -139,6 +109,52 @@ def apply_meta(f, meta=None, name_space=None):
     return f, meta
 
 
+@functools.lru_cache(maxsize=1024)
+def _value_params_wrapper(f, err_str_params, number_params, str_params, cse_params):
+    """Wrap for the params which do not depend on the name space
+
+    Each eval context loads its functions through apply_meta, so this
+    part of the wrapping is shared, and only refs_wrapper is per context
+    """
+    # find what all_params for this function should look like
+    try:
+        sig = inspect.signature(f)
+        if any(param.kind == inspect.Parameter.VAR_KEYWORD
+               for param in sig.parameters.values()):
+            raise RuntimeError(
+                f'Function {f.__name__}: **kwargs not allowed in signature.')
+    except ValueError:
+        # some built-ins do not have signature information
+        sig = None  # pragma: no cover
+    if sig and any(param.kind == inspect.Parameter.VAR_POSITIONAL
+                   for param in sig.parameters.values()):
+        all_params = ALL_ARG_INDICES
+    else:
+        all_params = set(range(getattr(getattr(f, '__code__', None), 'co_argcount', 0))
+                         ) or ALL_ARG_INDICES
+
+    # process error strings
+    if err_str_params is not None:
+        f = error_string_wrapper(
+            f, all_params if err_str_params == -1 else err_str_params)
+
+    # process number parameters
+    if number_params is not None:
+        f = nums_wrapper(
+            f, all_params if number_params == -1 else number_params)
+
+    # process str parameters
+    if str_params is not None:
+        f = strs_wrapper(f, all_params if str_params == -1 else str_params)
+
+    # process CSE parameters
+    if cse_params is not None:
+        f = cse_array_wrapper(
+            f, all_params if cse_params == -1 else cse_params)
+
+    return f
+
+
 def convert_params_indices(f, param_indices):
     """Given parameter indices, return a set of parameter indices to process
 
@@ -183,6 +199,11 @@ def cse_array_wrapper(f, param_indices=None):
             num_rows = len(args[a_cse_arg])
             num_cols = len(args[a_cse_arg][0])
 
+            if num_rows * num_cols > CSE_NUMPY_MIN_CELLS:
+                result = cse_array_map(f, args, kwargs, cse_arg_nums, (num_rows, num_cols))
+                if result is not None:
+                    return result
+
             return tuple(tuple(
                 f(*pick_args(args, cse_arg_nums, row, col), **kwargs)
                 for col in range(num_cols)) for row in range(num_rows))
@@ -192,6 +213,38 @@ def cse_array_wrapper(f, param_indices=None):
     return wrapper
 
 
+def cse_array_map(f, args, kwargs, cse_arg_nums, shape):
+    """Call f once per element of the cse array args using numpy.frompyfunc
+
+    :param f: function to call
+    :param args: args for f
+    :param kwargs: kwargs for f
+    :param cse_arg_nums: indices of the args which are cse arrays
+    :param shape: (rows, cols) of the cse arrays
+    :return: tuple of tuples, or None if numpy can not do this call
+    """
+    if len(args) >= CSE_NUMPY_MAX_ARGS:
+        # numpy ufuncs have a limit on the number of operands
+        return None
+
+    arrays = []
+    for arg_num, arg in enumerate(args):
+        if arg_num in cse_arg_nums:
+            array = np.array(arg, dtype=object)
+            if array.shape != shape:
+                return None
+        else:
+            # a 0-d array broadcasts the arg as is, even if it is a tuple
+            array = np.empty((), dtype=object)
+            array[()] = arg
+        arrays.append(array)
+
+    if kwargs:
+        f = functools.partial(f, **kwargs)
+    result = np.frompyfunc(f, len(arrays), 1)(*arrays)
+    return tuple(map(tuple, result))
+
+
 def nums_wrapper(f, param_indices=None):
     """wrapper for functions that take numbers, does excel style conversions
 
@@ -206,16 +259,19 @@ def nums_wrapper(f, param_indices=None):
 
     @functools.wraps(f)
     def wrapper(*args):
-        new_args = tuple(coerce_to_number(a, convert_all=True)
-                         if i in param_indices else a
-                         for i, a in enumerate(args))
-        error = next((a for i, a in enumerate(new_args)
-                      if i in param_indices and a in ERROR_CODES), None)
-        if error:
-            return error
-
-        if any(i in param_indices and not is_number(a)
-               for i, a in enumerate(new_args)):
+        # coerce and check in a single pass, the first error takes
+        # precedence over any non-number
+        new_args = list(args)
+        not_a_number = False
+        for i, a in enumerate(args):
+            if i in param_indices:
+                a = new_args[i] = coerce_to_number(a, convert_all=True)
+                if not is_number(a):
+                    if a in ERROR_CODES:
+                        return a
+                    not_a_number = True
+
+        if not_a_number:
             return VALUE_ERROR
 
         try:
@@ -269,11 +325,11 @@ def error_string_wrapper(f, param_indices=None):
 
     @functools.wraps(f)
     def wrapper(*args):
+        num_args = len(args)
         for arg_num in param_indices:
-            try:
-                arg = args[arg_num]
-            except IndexError:
+            if arg_num >= num_args:
                 break
+            arg = args[arg_num]
             if isinstance(arg, str) and arg in ERROR_CODES:
                 return arg
             elif isinstance(arg, tuple):
@@ -327,15 +383,27 @@ def built_in_wrapper(f, wrapper_marker, name_space):
     return apply_meta(f, meta, name_space)[0]
 
 
+@functools.lru_cache(maxsize=4096)
+def find_function(name, modules):
+    """Find name in the first module which has it
+
+    Each eval context looks up the same names in the same modules, so
+    the result, including not found, is cached
+
+    :param name: name of the function
+    :param modules: tuple of modules to search, in order
+    :return: (function, module) or (None, None)
+    """
+    funcs = ((getattr(module, name, None), module) for module in modules)
+    return next((f for f in funcs if f[0] is not None), (None, None))
+
+
 def load_functions(names, name_space, modules):
     # load desired functions into namespace from modules
     not_found = set()
     for name in names:
         if name not in name_space:
-            funcs = ((getattr(module, name, None), module)
-                     for module in modules)
-            f, module = next(
-                (f for f in funcs if f[0] is not None), (None, None))
+            f, module = find_function(name, modules)
             if f is None:
                 not_found.add(name)
             else:
@@ -20,7 +20,7 @@ from pycel.excelutil import (
     coerce_to_number,
     DIV0,
     ERROR_CODES,
-    find_corresponding_index,
+    find_corresponding_index_generator,
     flatten,
     handle_ifs,
     list_like,
@@ -200,8 +200,7 @@ def countif(rng, criteria):
     #   COUNTIF-function-e0de10c6-f885-4e71-abb4-1f464816df34
     if not list_like(rng):
         rng = ((rng, ), )
-    valid = find_corresponding_index(rng, criteria)
-    return len(valid)
+    return sum(1 for _ in find_corresponding_index_generator(rng, criteria))
 
 
 def countifs(*args):
@@ -480,7 +480,8 @@ def mid(text, start_num, num_chars):
 
     start_num = int(start_num) - 1
 
-    return str(text)[start_num:start_num + int(num_chars)]
+    # str_params has already coerced text to a str
+    return text[start_num:start_num + int(num_chars)]
 
 
 # def midb(text):
@@ -9,7 +9,6 @@
 
 import os
 import shutil
-from unittest import mock
 
 import pytest
 from openpyxl.utils import column_index_from_string
@@ -42,26 +41,53 @@ def fixture_dir():
 
 
 @pytest.fixture(scope='session')
-def tmpdir(tmpdir_factory):
-    return tmpdir_factory.mktemp('fixtures')
+def fixtures_tmp_path(tmp_path_factory):
+    return tmp_path_factory.mktemp('fixtures')
 
 
 @pytest.fixture(scope='session')
-def serialization_override_path(tmpdir):
-    return os.path.join(str(tmpdir), 'excelcompiler_serialized.yml')
+def serialization_override_path(fixtures_tmp_path):
+    return os.path.join(fixtures_tmp_path, 'excelcompiler_serialized.yml')
 
 
-def copy_fixture_xls_path(fixture_dir, tmpdir, filename):
+def copy_fixture_xls_path(fixture_dir, fixtures_tmp_path, filename):
     src = os.path.join(fixture_dir, filename)
-    dst = os.path.join(str(tmpdir), filename)
-    shutil.copy(src, dst)
+    dst = os.path.join(fixtures_tmp_path, filename)
+    try:
+        # the workbooks are only ever read, so a link is as good as a copy
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
     return dst
 
 
 @pytest.fixture(scope='session')
-def fixture_xls_copy(fixture_dir, tmpdir):
+def fixture_xls_copy(fixture_dir, fixtures_tmp_path):
+    # each fixture file only needs to be copied once per session
+    copies = {}
+
+    def wrapped(filename):
+        if filename not in copies:
+            copies[filename] = copy_fixture_xls_path(
+                fixture_dir, fixtures_tmp_path, filename)
+        return copies[filename]
+    return wrapped
+
+
+@pytest.fixture(scope='session')
+def fixture_xls_wrapper(fixture_xls_copy):
+    """Parse each fixture workbook only once per session
+
+    For tests which build their own compiler over the shared workbook with
+    ``ExcelCompiler(excel=...)``, and so still get their own cells.
+    """
+    wrappers = {}
+
     def wrapped(filename):
-        return copy_fixture_xls_path(fixture_dir, tmpdir, filename)
+        if filename not in wrappers:
+            wrappers[filename] = ExcelWrapperImpl(fixture_xls_copy(filename))
+            wrappers[filename].load()
+        return wrappers[filename]
     return wrapped
 
 
@@ -77,16 +103,21 @@ def fixture_xls_path_circular(fixture_xls_copy):
 
 @pytest.fixture(scope='session')
 def unconnected_excel(fixture_xls_path):
-    import openpyxl.worksheet._reader as orw
-    old_warn = orw.warn
+    # the warnings about unknown extensions are quieted in tox.ini
+    return ExcelWrapperImpl(fixture_xls_path)
 
-    def new_warn(msg, *args, **kwargs):
-        if 'Unknown' not in msg:
-            old_warn(msg, *args, **kwargs)
 
-    # quiet the warnings about unknown extensions
-    with mock.patch('openpyxl.worksheet._reader.warn', new_warn):
-        yield ExcelWrapperImpl(fixture_xls_path)
+@pytest.fixture(scope='session')
+def connected_excel(unconnected_excel):
+    """Workbook loaded once per session, for tests which only read it
+
+    Reading a cell outside of the used range adds it to an openpyxl sheet,
+    so tests which do that, or which otherwise change the workbook, need
+    the freshly loaded `excel` fixture instead.
+    """
+    excel = ExcelWrapperImpl(unconnected_excel.filename)
+    excel.load()
+    return excel
 
 
 @pytest.fixture
@@ -106,8 +137,8 @@ def cond_format_ws(fixture_xls_copy):
 
 
 @pytest.fixture
-def circular_ws(fixture_xls_path_circular):
-    return ExcelCompiler(fixture_xls_path_circular, cycles=True)
+def circular_ws(fixture_xls_wrapper):
+    return ExcelCompiler(excel=fixture_xls_wrapper('circular.xlsx'), cycles=True)
 
 
 @pytest.fixture
@@ -26,6 +26,7 @@ from pycel.lib.date_time import (
     DateTimeFormatter,
     datevalue,
     is_leap_year,
+    leap_years_through,
     max_days_in_month,
     MICROSECOND,
     normalize_year,
@@ -97,6 +98,8 @@ def test_time_from_serialnumber_microsecond(result, value):
         ((23, 59, 59), 0 - MICROSECOND * 5e5),
         ((23, 59, 59), 1 - MICROSECOND * 5e5),
         ((2, 24, 0), 1.1),
+        ((9, 23, 0), 28094 + (9 * 3600 + 22 * 60 + 59.6) * SECOND),
+        ((0, 0, 0), 2 - 0.4 * SECOND),
     )
 )
 def test_time_from_serialnumber(result, value):
@@ -129,6 +132,21 @@ def test_is_leap_year(value, result):
         assert is_leap_year(value) == result
 
 
+@pytest.mark.parametrize(
+    'first, last', (
+        (1, 1),
+        (1896, 1904),
+        (1899, 1900),
+        (1900, 1900),
+        (1901, 2024),
+        (1700, 2100),
+    )
+)
+def test_leap_years_through(first, last):
+    expected = sum(is_leap_year(year) for year in range(first, last + 1))
+    assert leap_years_through(last) - leap_years_through(first - 1) == expected
+
+
 def test_get_max_days_in_month():
     assert 31 == max_days_in_month(1, 2000)
     assert 29 == max_days_in_month(2, 2000)
@@ -158,7 +176,10 @@ def test_get_max_days_in_month():
         ((1900, 4, 1), (1900, 0, 123)),
         ((1900, 3, 1), (1900, -1, 122)),
 
-        ((1899, 12, 1), (1900, 1, -31)),
+        ((1899, 11, 30), (1900, 1, -31)),
+        ((2008, 2, 29), (2008, 3, 0)),
+        ((2117, 7, 7), (2008, 1, 40000)),
+        ((1898, 6, 26), (2008, 1, -40000)),
         ((1899, 12, 1), (1900, 0, 1)),
         ((1899, 11, 1), (1900, -1, 1)),
 
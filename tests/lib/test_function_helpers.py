@@ -7,11 +7,13 @@
 # You may obtain a copy of the Licence at:
 #   https://www.gnu.org/licenses/gpl-3.0.en.html
 
-import importlib
 import math
 
 import pytest
 
+import pycel.excellib
+import pycel.lib.date_time
+import pycel.lib.logical
 from pycel.excelutil import (
     AddressCell,
     AddressRange,
@@ -25,7 +27,9 @@ from pycel.lib.function_helpers import (
     error_string_wrapper,
     excel_helper,
     excel_math_func,
+    find_function,
     load_functions,
+    nums_wrapper,
 )
 
 
@@ -51,6 +55,26 @@ def test_cse_array_wrapper(arg_num, f_args, result):
     assert cse_array_wrapper(f_test, arg_num)(*f_args) == result
 
 
+def test_cse_array_wrapper_large():
+    data = tuple(tuple(range(row, row + 7)) for row in range(6))
+    other = ((1, 2),)
+
+    def f_test(*args, offset=0):
+        return args[0] + len(args[1]) + offset
+
+    result = cse_array_wrapper(f_test, 0)(data, other, offset=1)
+    assert result == tuple(tuple(x + 2 for x in row) for row in data)
+
+    # mismatched shapes are indexed by the first cse array, as before
+    wider = tuple(row + (0,) for row in data)
+    result = cse_array_wrapper(lambda a, b: a + b, (0, 1))(data, wider)
+    assert result == tuple(tuple(2 * x for x in row) for row in data)
+
+    # more args than numpy ufuncs support
+    args = (data,) + (0,) * 40
+    assert cse_array_wrapper(lambda *a: sum(a), 0)(*args) == data
+
+
 @pytest.mark.parametrize(
     'arg_nums, f_args, result', (
         (((0, 1, 2, 3)), ((0, NUM_ERROR), (DIV0, NUM_ERROR)), NUM_ERROR),
@@ -84,6 +108,20 @@ def test_math_wrap(value, result):
         excel_math_func(lambda x: x), name_space={})[0](value) == result
 
 
+@pytest.mark.parametrize(
+    'args, result', (
+        ((1, '2'), 3),
+        (('x', DIV0), DIV0),
+        ((NUM_ERROR, DIV0), NUM_ERROR),
+        (('x', 1), VALUE_ERROR),
+        ((1, 'x', 'y'), VALUE_ERROR),
+        ((1, 2, 'y'), 3),
+    )
+)
+def test_nums_wrapper(args, result):
+    assert nums_wrapper(lambda a, b, c=0: a + b, (0, 1))(*args) == result
+
+
 def test_math_wrap_domain_error():
     func = apply_meta(excel_math_func(lambda x: math.log(x)), name_space={})[0]
     assert func(-1) == NUM_ERROR
@@ -121,6 +159,18 @@ def test_apply_meta_nothing_active():
     assert func == a_test_func
 
 
+def test_apply_meta_wrapper_cached():
+
+    def a_test_func(x):
+        return x
+
+    a_test_func = excel_helper(cse_params=0, ref_params=-1)(a_test_func)
+    func = apply_meta(a_test_func, name_space={})[0]
+    assert func is not a_test_func
+    assert func is apply_meta(a_test_func, name_space={})[0]
+    assert func(((1, 2),)) == ((1, 2),)
+
+
 def test_apply_meta_kwargs():
 
     def a_test_func(**x):
@@ -134,10 +184,10 @@ def test_apply_meta_kwargs():
 def test_load_functions():
 
     modules = (
-        importlib.import_module('pycel.excellib'),
-        importlib.import_module('pycel.lib.date_time'),
-        importlib.import_module('pycel.lib.logical'),
-        importlib.import_module('math'),
+        pycel.excellib,
+        pycel.lib.date_time,
+        pycel.lib.logical,
+        math,
     )
 
     namespace = locals()
@@ -162,3 +212,17 @@ def test_load_functions():
     missing = load_functions(['log'], namespace, modules)
     assert not missing
     assert namespace['log'](DIV0) == DIV0
+
+
+def test_find_function():
+    modules = (
+        pycel.lib.logical,
+        math,
+    )
+
+    assert find_function('log', modules) == (math.log, modules[1])
+    assert find_function('junk', modules) == (None, None)
+
+    hits = find_function.cache_info().hits
+    assert find_function('junk', modules) == (None, None)
+    assert find_function.cache_info().hits == hits + 1
@@ -623,8 +623,8 @@ def test_cell_repr(excel):
     assert 'sheet!A1 -> 0' == repr(cell_range)
 
 
-def test_gen_gexf(excel_compiler, tmpdir):
-    filename = os.path.join(str(tmpdir), 'test.gexf')
+def test_gen_gexf(excel_compiler, tmp_path):
+    filename = os.path.join(tmp_path, 'test.gexf')
     assert not os.path.exists(filename)
     excel_compiler.export_to_gexf(filename)
 
@@ -632,7 +632,7 @@ def test_gen_gexf(excel_compiler, tmpdir):
     assert os.path.exists(filename)
 
 
-def test_gen_dot(excel_compiler, tmpdir):
+def test_gen_dot(excel_compiler):
     with pytest.raises(ImportError, match="Package 'pydot' is not installed"):
         excel_compiler.export_to_dot()
 
@@ -647,7 +647,7 @@ def test_gen_dot(excel_compiler, tmpdir):
         excel_compiler.export_to_dot()
 
 
-def test_plot_graph(excel_compiler, tmpdir):
+def test_plot_graph(excel_compiler):
     with pytest.raises(ImportError,
                        match="Package 'matplotlib' is not installed"):
         excel_compiler.plot_graph()
@@ -879,7 +879,7 @@ def test_evaluate_not_pre_existing_range(fixture_dir):
     assert excel_compiler.evaluate('Sheet1!B5:B8') == (18, 21, 24, 27)
 
 
-def test_save_restore_numpy_float(basic_ws, tmpdir):
+def test_save_restore_numpy_float(basic_ws, tmp_path):
     addr = AddressCell('Sheet1!A1')
     cell_value = basic_ws.evaluate(addr)
     assert not isinstance(cell_value, np.float64)
@@ -889,7 +889,7 @@ def test_save_restore_numpy_float(basic_ws, tmpdir):
     assert isinstance(cell_value, np.float64)
     assert cell_value == 8.0
 
-    tmp_name = os.path.join(tmpdir, 'numpy_test')
+    tmp_name = os.path.join(tmp_path, 'numpy_test')
     basic_ws.to_file(tmp_name)
 
     excel_compiler = ExcelCompiler.from_file(tmp_name)
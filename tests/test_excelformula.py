@@ -15,6 +15,7 @@ from unittest import mock
 
 import numpy as np
 import pytest
+from openpyxl.formula.tokenizer import TokenizerError
 
 from pycel.excelformula import (
     ASTNode,
@@ -22,6 +23,7 @@ from pycel.excelformula import (
     FormulaEvalError,
     FormulaParserError,
     Token,
+    Tokenizer,
     UnknownFunction,
 )
 from pycel.excelutil import (
@@ -448,10 +450,11 @@ test_names = (
     'reference_inputs',
 )
 
-test_data = []
-for test_name in test_names:
-    for i, test in enumerate(globals()[test_name]):
-        test_data.append((f'{test_name}_{i + 1}', test[0], test[1], test[2]))
+test_data = tuple(
+    pytest.param(*test, id=f'{test_name}_{i + 1}')
+    for test_name in test_names
+    for i, test in enumerate(globals()[test_name])
+)
 
 
 def dump_all_test_cases():
@@ -461,18 +464,53 @@ def dump_all_test_cases():
         print()
 
 
-@pytest.mark.parametrize('test_number, formula, rpn, python_code', test_data)
-def test_tokenizer(test_number, formula, rpn, python_code):
-    assert rpn == stringify_rpn(ExcelFormula(formula).rpn)
+@pytest.mark.parametrize('formula, rpn, python_code', test_data)
+def test_tokenizer(formula, rpn, python_code):
+    assert rpn.split('|') == [str(token) for token in ExcelFormula(formula).rpn]
 
 
-@pytest.mark.parametrize('test_number, formula, rpn, python_code', test_data)
-def test_parse(test_number, formula, rpn, python_code, ATestCell):
-    cell = ATestCell('A', 1)
+@pytest.mark.parametrize(
+    'formula, expected', (
+        ('=Table1[[#This Row],[col]]', 'Table1[[#This Row],[col]]'),
+        ('=[1]Sheet1!A1', '[1]Sheet1!A1'),
+        ('=SUM(Table1[col])', 'Table1[col]'),
+        ('=Table1[col]:Table1[col2]', 'Table1[col]:Table1[col2]'),
+    )
+)
+def test_tokenizer_brackets(formula, expected):
+    assert expected in [t.value for t in Tokenizer(formula).items]
+
 
-    excel_formula = ExcelFormula(formula, cell=cell)
-    parsed = excel_formula.rpn
-    result_rpn = "|".join(str(x) for x in parsed)
+@pytest.mark.parametrize('formula', ('=A[1', '=A[[1]', '=Table1[[#All],[col]'))
+def test_tokenizer_unmatched_brackets(formula):
+    with pytest.raises(TokenizerError, match="unmatched '\\['"):
+        Tokenizer(formula)
+
+
+def test_tokenizer_cached_stream_gives_fresh_tokens():
+    formula = '=SUM(A1:B2, {1,2;3,4})'
+    first = ExcelFormula(formula).rpn
+    second = ExcelFormula(formula).rpn
+    assert stringify_rpn(first) == stringify_rpn(second)
+    assert all(a.token is not b.token for a, b in zip(first, second))
+
+
+@pytest.fixture(scope='module')
+def parsed_formulas(ATestCell):
+    # parse all of the test formulas in one pass, and share them between cases
+    cell = ATestCell('A', 1)
+    parsed = {}
+    for test in test_data:
+        formula = test.values[0]
+        if formula not in parsed:
+            parsed[formula] = ExcelFormula(formula, cell=cell)
+            parsed[formula].ast
+    return parsed
+
+
+@pytest.mark.parametrize('formula, rpn, python_code', test_data)
+def test_parse(formula, rpn, python_code, parsed_formulas):
+    excel_formula = parsed_formulas[formula]
     try:
         result_python_code = excel_formula.python_code
     except AttributeError as exc:
@@ -483,7 +521,8 @@ def test_parse(test_number, formula, rpn, python_code, ATestCell):
 
     assert result_python_code == excel_formula.ast.emit
 
-    if (rpn, python_code) != (result_rpn, result_python_code):
+    if result_python_code != python_code:
+        result_rpn = stringify_rpn(excel_formula.rpn)
         print("***Expected: ")
         dump_test_case(formula, python_code, rpn)
 
@@ -95,6 +95,16 @@ def test_address_range_errors():
         AddressRange('B32:B33:B')
 
 
+def test_address_range_create_cached():
+    assert AddressRange('sh!B1:C2') is AddressRange('sh!B1:C2')
+    assert AddressRange('B1', sheet='sh') is not AddressRange('B1')
+
+    # errors are not cached
+    for _ in range(2):
+        with pytest.raises(ValueError, match='Mismatched sheets'):
+            AddressRange('sh!B1', sheet='sh2')
+
+
 @pytest.mark.parametrize(
     'address, expected', (
         ('s!D2:F4:E3', 's!D2:F4'),
@@ -275,7 +285,7 @@ def test_address_range_columns():
     assert all('C' == addr.column for addr in columns[-1])
 
 
-def test_address_pickle(tmpdir):
+def test_address_pickle(tmp_path):
     addrs = [
         AddressRange('B1'),
         AddressRange('B1:C1'),
@@ -294,7 +304,7 @@ def test_address_pickle(tmpdir):
         AddressCell('sh!F6'),
     ]
 
-    filename = os.path.join(str(tmpdir), 'test_addrs.pkl')
+    filename = os.path.join(tmp_path, 'test_addrs.pkl')
     with open(filename, 'wb') as f:
         pickle.dump(addrs, f)
 
@@ -626,6 +636,10 @@ def test_multi_area_ranges(excel, ATestCell):
         ('1', 1, int, False),
         ('1.', 1.0, float, False),
         ('xyzzy', 'xyzzy', str, False),
+        ('A1', 'A1', str, False),
+        (' 2', 2, int, False),
+        ('-2.5', -2.5, float, False),
+        ('inf', float('inf'), float, False),
         (DIV0, DIV0, str, False),
         ('TRUE', 'TRUE', str, False),
         ('FALSE', 'FALSE', str, False),
@@ -817,6 +831,11 @@ def test_array_arg(data, expected):
         (None, False),
         ('False', False),
         ('x', False),
+        ('A1', False),
+        ('#DIV/0!', False),
+        ('', False),
+        (' 1', True),
+        ('nan', True),
         (AddressCell('A1'), False),
     )
 )
@@ -1025,6 +1044,12 @@ def test_criteria_parser(value, criteria, expected):
     assert expected == criteria_parser(criteria)(value)
 
 
+def test_criteria_parser_cached():
+    assert criteria_parser('>2') is criteria_parser('>2')
+    assert criteria_parser(1) is not criteria_parser(True)
+    assert criteria_parser(1)(1)
+
+
 @pytest.mark.parametrize(
     'lval, op, rval, expected', (
         (1, '>', 1, False),
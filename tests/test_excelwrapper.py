@@ -69,6 +69,16 @@ def test_get_formula_or_value(excel, address, value):
     assert value == from_opxl.get_formula_or_value(address)
 
 
+@pytest.mark.parametrize(
+    'address', ('Sheet1!A1:D18', 'ArrayForm!G16:H17', 'ArrayForm!E1:F3'))
+def test_range_formulas_match_cell_formulas(excel, address):
+    cells = AddressRange(address).resolve_range
+    assert excel.get_formula_from_range(address) == tuple(
+        tuple(excel.get_formula_from_range(a) for a in row) for row in cells)
+    assert excel.get_formula_or_value(address) == tuple(
+        tuple(excel.get_formula_or_value(a) for a in row) for row in cells)
+
+
 @pytest.mark.parametrize(
     'address1, address2',
     [
@@ -120,21 +130,21 @@ def test_get_range_value(excel):
     assert result is None
 
 
-def test_get_defined_names(excel):
+def test_get_defined_names(connected_excel):
     expected = {'SINUS': [('$C$1:$C$18', 'Sheet1')]}
-    assert expected == excel.defined_names
+    assert expected == connected_excel.defined_names
 
-    assert excel.defined_names == excel.defined_names
+    assert connected_excel.defined_names == connected_excel.defined_names
 
 
-def test_get_tables(excel):
+def test_get_tables(connected_excel):
     for table_name in ('Table1', 'tAbLe1'):
-        table, sheet_name = excel.table(table_name)
+        table, sheet_name = connected_excel.table(table_name)
         assert 'sref' == sheet_name
         assert 'D1:F4' == table.ref
         assert 'Table1' == table.name
 
-    assert (None, None) == excel.table('JUNK')
+    assert (None, None) == connected_excel.table('JUNK')
 
 
 @pytest.mark.parametrize(
@@ -151,8 +161,8 @@ def test_get_tables(excel):
         ('sref!F5', None),
     ]
 )
-def test_table_name_containing(excel, address, table_name):
-    table = excel.table_name_containing(address)
+def test_table_name_containing(connected_excel, address, table_name):
+    table = connected_excel.table_name_containing(address)
     if table_name is None:
         assert table is None
     else:
@@ -190,16 +200,16 @@ def test_table_name_containing(excel, address, table_name):
          ),
     ]
 )
-def test_array_formulas(excel, address, values, formula):
-    result = excel.get_range(address)
+def test_array_formulas(connected_excel, address, values, formula):
+    result = connected_excel.get_range(address)
     assert result.address == AddressRange(address)
     assert result.values == values
     if result.formula:
         assert result.formula == formula
 
 
-def test_get_datetimes(excel):
-    result = excel.get_range("datetime!A1:B13").values
+def test_get_datetimes(connected_excel):
+    result = connected_excel.get_range("datetime!A1:B13").values
     for row in result:
         assert row[0] == row[1]
 